@@ -3,21 +3,42 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, Optional, Callable
 from pydantic import BaseModel # pyright: ignore[reportMissingImports]
+from pydantic_core import PydanticSerializationError # pyright: ignore[reportMissingImports]
+from .config import aif_config
+from .constant import SYSTEM_STEP, _DEBUG_SEPARATOR
+
+
+def _is_plain_model(data: Any) -> bool:
+    """True for pydantic models that don't customize __str__ (rendered as JSON)."""
+    return isinstance(data, BaseModel) and type(data).__str__ is BaseModel.__str__
+
+
+def _model_to_json(model: BaseModel) -> bytes:
+    """
+    Serialize a model straight through its pydantic-core serializer,
+    bypassing the Python-level model_dump_json() wrapper.
+    Models the serializer can't handle (e.g. arbitrary-type fields) fall back
+    to str(model), as dump_data_to_str did before models were rendered as JSON.
+    """
+    try:
+        return model.__pydantic_serializer__.to_json(model, indent=2)
+    except (PydanticSerializationError, TypeError, ValueError):
+        return str(model).encode("utf-8")
 
 
 def _debug_log_artifact(artifact: 'Artifact', context: str = ""):
     """
     Internal helper to log artifact transmission details when debug is enabled.
+    Hot call sites should check `aif_config.debug_artifact_transmission` first
+    so the call is skipped entirely when debug is off.
     """
-    from .config import aif_config
-    
-    if not aif_config.is_debug_artifact_enabled():
+    if not aif_config.debug_artifact_transmission:
         return
-    print("      ","-"*15)
+    print(_DEBUG_SEPARATOR)
     print(f"      🔍 [Debug] Artifact {context} start")
     print(f"      Last Step: {artifact.last_step} → Next Step: {artifact.next_step}")
     print(f"      Pass Data: 【{artifact.pass_data}】")
-    print("      ","-"*15,)
+    print(_DEBUG_SEPARATOR)
 
 
 class Artifact(BaseModel):
@@ -27,7 +48,7 @@ class Artifact(BaseModel):
     and carries the data payload between steps.
     """
     # Step Lineage
-    last_step: str = "system"        # The step that just finished
+    last_step: str = SYSTEM_STEP     # The step that just finished
     next_step: Optional[str] = None  # The step this artifact is destined for
     
     # Data Payload - now supports str, dict, or list
@@ -45,6 +66,10 @@ class Artifact(BaseModel):
                 return json.dumps(data, ensure_ascii=False, indent=2)
             except (TypeError, ValueError):
                 return str(data)
+        if _is_plain_model(data):
+            # Plain models render as JSON; models with their own __str__
+            # (e.g. CrewAI's CrewOutput, which shows the raw output) keep it.
+            return _model_to_json(data).decode("utf-8")
         return str(data)
     
     def get_data(self, key: Optional[str] = None) -> Any:
@@ -57,6 +82,8 @@ class Artifact(BaseModel):
         Returns:
             The data (preserving original type) or specific key value
         """
+        if key is None:
+            return self.pass_data
         if key and isinstance(self.pass_data, dict):
             return self.pass_data.get(key)
         return self.pass_data
@@ -70,3 +97,19 @@ class Artifact(BaseModel):
             String representation of pass_data
         """
         return self.dump_data_to_str(self.pass_data)
+    
+    def get_data_as_bytes(self) -> bytes:
+        """
+        Get the data payload as UTF-8 encoded bytes.
+        Useful for sinks that write bytes (files, sockets); bytes payloads are
+        returned unchanged.
+        
+        Returns:
+            Bytes representation of pass_data
+        """
+        data = self.pass_data
+        if isinstance(data, bytes):
+            return data
+        if _is_plain_model(data):
+            return _model_to_json(data)
+        return self.get_data_as_str().encode("utf-8")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union, Callable, Literal, TYPE_CHECKING
 from pydantic import BaseModel # pyright: ignore[reportMissingImports]
@@ -27,6 +28,10 @@ class RollbackInfo(BaseModel):
 # StepResult removed as Artifact is now the direct carrier of status and data.
 
 # Constants
+# Pseudo step names recorded as Artifact.last_step (interned, shared by every Artifact)
+SYSTEM_STEP = sys.intern("system")
+USER_INPUT_STEP = sys.intern("User Input")
+
 HUMAN_ASK_PRINCIPLE = (
     "\n\nIMPORTANT PRINCIPLE: You have access to an 'Ask User' tool. "
     "Prioritize solving the task independently using your available tools and knowledge. "
@@ -34,6 +39,22 @@ HUMAN_ASK_PRINCIPLE = (
     "or persistent errors. Avoid asking the user for confirmation unless strictly necessary."
 )
 
+# Crew kickoff input key; step Tasks reference it as "{input}" in their descriptions
+CREW_INPUT_KEY = "input"
+
+# Crew kickoff input key carrying the result to validate; validator Tasks reference it as "{validation_input}"
+VALIDATION_INPUT_KEY = "validation_input"
+
+# Feedback history entry types
+FEEDBACK_TYPE_USER = "user_feedback"
+FEEDBACK_TYPE_VALIDATION = "validation_error"
+
+# Labels used for each feedback type in the cumulative retry context
+FEEDBACK_TYPE_LABELS = {
+    FEEDBACK_TYPE_USER: "User Feedback",
+    FEEDBACK_TYPE_VALIDATION: "Validation Error",
+}
+
 # Feedback and Validation Context Templates
 FEEDBACK_CONTEXT_HEADER = "=== USER FEEDBACK ==="
 FEEDBACK_CONTEXT_EXPLANATION = (
@@ -54,3 +75,15 @@ CUMULATIVE_CONTEXT_INSTRUCTIONS = (
 
 CUMULATIVE_CONTEXT_FEEDBACK_INSTRUCTION = "2. Address all user feedback (additional requirements from human)\n"
 CUMULATIVE_CONTEXT_VALIDATION_INSTRUCTION = "3. Fix all validation errors (system quality checks that failed)\n"
+
+# User Confirmation Prompt Templates
+USER_CONFIRMATION_OPTIONS = (
+    "\n\nOptions:\n"
+    "- Press Enter or type 'yes' to confirm and continue\n"
+    "- Type feedback directly to retry step\n"
+    "- '/rollback [reason]' to rollback flow"
+)
+RETRY_RECOMMENDATION = "\n(Recommended: Retry with your new comments)"
+
+# Separator line framing the debug reports of artifacts and Crew kickoffs
+_DEBUG_SEPARATOR = "       " + "-" * 15
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Callable, Union, Any
-from crewai import Crew # pyright: ignore[reportMissingImports]
+import asyncio
+from typing import List, Optional, Dict, Callable, Union, Any, TYPE_CHECKING
 from aif.step import Step, NextStep
 from aif.artifact import Artifact, _debug_log_artifact
-from aif.constant import RetryValidator
+from aif.config import aif_config
+from aif.constant import RetryValidator, USER_INPUT_STEP
 from aif.interactive import InteractionManager, UserExitException, RollbackException
 
+if TYPE_CHECKING:
+    from crewai import Crew # pyright: ignore[reportMissingImports]
+
 class AIFFlow:
     """
     AIF Main Flow class.
@@ -21,14 +25,14 @@ class AIFFlow:
         self.history: List[Artifact] = []  # Stores output of each successful step
         self._rollback_reason: Optional[str] = None
         
-        self.step_map: Dict[str, Step] = {}
-        self._steps_sequence: List[str] = [] # Track order for implicit next_step
+        self.step_map: Dict[str, Step] = {}  # Insertion order is the implicit step sequence
+        self._implicit_next: Dict[str, Optional[str]] = {}  # Step name -> next step in add order
         self.start_step: Optional[str] = None
 
     def add_step_from_crew(
         self,
         name: str,
-        step_object: Union[Crew, Callable],
+        step_object: Union['Crew', Callable],
         output_processor: Optional[Callable[[Any], tuple[Any, Any]]] = None,
         guard_callback: Optional[RetryValidator] = None,
         next_step: NextStep = None,
@@ -79,8 +83,11 @@ class AIFFlow:
     def _add_step_internal(self, step: Step):
         if step.name in self.step_map:
              raise ValueError(f"Step '{step.name}' already exists in Flow.")
+        if self.step_map:
+            # The previously last-added step now implicitly continues to this one
+            self._implicit_next[next(reversed(self.step_map))] = step.name
         self.step_map[step.name] = step
-        self._steps_sequence.append(step.name)
+        self._implicit_next[step.name] = None
         
         # If this is the first step added and no start_step defined, set it
         if self.start_step is None:
@@ -88,20 +95,24 @@ class AIFFlow:
 
     def inspect(self):
         """View the complete step flow structure."""
-        print("\n📋 [Flow Configuration]")
-        print(f"   Start Step: {self.start_step}")
-        print(f"   Steps Sequence:")
-        for i, name in enumerate(self._steps_sequence):
-            step = self.step_map[name]
+        # Build the report first and emit it with a single write
+        lines = [
+            "\n📋 [Flow Configuration]",
+            f"   Start Step: {self.start_step}",
+            "   Steps Sequence:",
+        ]
+        for i, (name, step) in enumerate(self.step_map.items()):
             next_s = step.next_step
-            if next_s is None and i + 1 < len(self._steps_sequence):
-                next_s = f"{self._steps_sequence[i+1]} (Implicit)"
+            implicit_next = self._implicit_next.get(name)
+            if next_s is None and implicit_next is not None:
+                next_s = f"{implicit_next} (Implicit)"
             elif next_s is None:
                 next_s = "End"
             
-            print(f"      {i+1}. [{name}] → {next_s}")
-            print(f"         Confirm: {step.require_user_confirmation}")
-        print()
+            lines.append(f"      {i+1}. [{name}] → {next_s}")
+            lines.append(f"         Confirm: {step.require_user_confirmation}")
+        lines.append("")
+        print("\n".join(lines))
 
     async def run(self, initial_input: Optional[str] = None) -> Artifact:
         """
@@ -112,6 +123,9 @@ class AIFFlow:
             initial_input: Optional initial input to start the flow with.
                           Priority: method parameter > InteractionManager.initial_input > interactive prompt
         """
+        # AskUserTool calls from CrewAI worker threads are scheduled onto this loop
+        self.interactive.loop = asyncio.get_running_loop()
+
         # Priority: method parameter > InteractionManager preset > interactive prompt
         if initial_input is not None:
             # Use the provided parameter
@@ -123,8 +137,10 @@ class AIFFlow:
             # Ask the user interactively
             actual_initial_input = await self.interactive.get_initial_input()
         
-        current_artifact = Artifact(
-            last_step="User Input",
+        # Internal construction sites use model_construct() to skip validation:
+        # the fields are produced by the Flow itself, not by user input.
+        current_artifact = Artifact.model_construct(
+            last_step=USER_INPUT_STEP,
             next_step=self.start_step,
             pass_data=actual_initial_input
         )
@@ -143,7 +159,8 @@ class AIFFlow:
 
             try:
                 # Debug log: Input artifact before step execution
-                _debug_log_artifact(current_artifact, f"[Before {step.name}]")
+                if aif_config.debug_artifact_transmission:
+                    _debug_log_artifact(current_artifact, f"[Before {step.name}]")
                 
                 # Execute step (handles retry loops internally)
                 output_artifact = await step.execute(
@@ -151,7 +168,8 @@ class AIFFlow:
                 )
                 
                 # Debug log: Output artifact after step execution
-                _debug_log_artifact(output_artifact, f"[After {step.name}]")
+                if aif_config.debug_artifact_transmission:
+                    _debug_log_artifact(output_artifact, f"[After {step.name}]")
                 
                 self.history.append(output_artifact)
                 current_artifact = output_artifact
@@ -177,15 +195,9 @@ class AIFFlow:
                     else:
                         print(f"   ⚠️  Invalid next_step type in step {step.name}. Ending flow.")
                 else:
-                    # Implicit next step from sequence
-                    try:
-                        # Find index of current step in the sequence
-                        current_idx = self._steps_sequence.index(step.name)
-                        if current_idx + 1 < len(self._steps_sequence):
-                            current_step_name = self._steps_sequence[current_idx + 1]
-                    except ValueError:
-                         # Current step not in sequence list (shouldn't happen if initialized correctly)
-                         pass
+                    # Implicit next step from sequence (steps put straight into
+                    # step_map have none, so the flow ends there)
+                    current_step_name = self._implicit_next.get(step.name)
 
             except UserExitException:
                 print("\n⚠️  Flow exited by user")
@@ -210,8 +222,8 @@ class AIFFlow:
                     if self.history:
                         current_artifact = self.history[-1]
                     else:
-                         current_artifact = Artifact(
-                            last_step="User Input",
+                         current_artifact = Artifact.model_construct(
+                            last_step=USER_INPUT_STEP,
                             next_step=self.start_step,
                             pass_data=actual_initial_input
                         )
@@ -226,6 +238,7 @@ class AIFFlow:
 
     def _get_step(self, name: str) -> Step:
         """Resolve step by name from local step map."""
-        if name in self.step_map:
-            return self.step_map[name]
-        raise ValueError(f"Step '{name}' not found in Flow configuration.")
+        step = self.step_map.get(name)
+        if step is None:
+            raise ValueError(f"Step '{name}' not found in Flow configuration.")
+        return step
@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from typing import Optional, Callable, Awaitable, Union, cast, List, Dict, Any
+import asyncio
+import inspect
+import sys
+from typing import TYPE_CHECKING, Optional, Callable, Awaitable, Union, cast, List, Dict, Any
+
+if TYPE_CHECKING:
+    from aif.tools import AskUserTool
+
+# History roles, interned so every entry shares one string object
+_ROLE_SYSTEM = sys.intern("system")
+_ROLE_USER = sys.intern("user")
+
+# Sync or async function that asks the user a question and returns the answer
+InputCallback = Union[Callable[[str], Awaitable[str]], Callable[[str], str]]
 
 
 async def console_input(question: str) -> str:
@@ -29,6 +42,14 @@ class RetryException(BaseException):
     """Exception raised when user requests to retry."""
     pass
 
+
+# Command word -> factory building the control-flow exception from the text after it
+_COMMANDS = {
+    "/exit": lambda arg: UserExitException("User requested exit"),
+    "/rollback": lambda arg: RollbackException(arg or "User requested rollback"),
+    "/retry": lambda arg: RetryException(arg or "User requested retry"),
+}
+
 class InteractionManager:
     """
     InteractionManager is the hub for all user interactions.
@@ -42,7 +63,7 @@ class InteractionManager:
         self,
         #If you are running on a terminal, input_callback in Python input();
         #If you are running on a webpage, input_callback in websocket. send().
-        input_callback: Union[Callable[[str], Awaitable[str]], Callable[[str], str]],
+        input_callback: InputCallback,
         initial_input: Optional[str] = None
     ):
         """
@@ -54,10 +75,38 @@ class InteractionManager:
         self.current_question: Optional[str] = None
         self.history: List[Dict[str, str]] = []
         self.context: Dict[str, Any] = {}
+        # AskUserTool bound to this manager, built on first use (see get_ask_tool())
+        self._ask_tool: Optional["AskUserTool"] = None
+        # Event loop the flow runs on, recorded by AIFFlow.run(); AskUserTool
+        # schedules questions onto it when called from a worker thread
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def input_callback(self) -> InputCallback:
+        """The callback used to ask the user."""
+        return self._input_callback
+
+    @input_callback.setter
+    def input_callback(self, callback: InputCallback):
+        # Classify the callback once here, not on every prompt
+        self._input_callback = callback
+        self._is_async = inspect.iscoroutinefunction(callback)
+
+    def get_ask_tool(self) -> "AskUserTool":
+        """
+        Get the AskUserTool bound to this manager.
+        The tool is built on first call and shared by every Step and retry afterwards.
+        """
+        if self._ask_tool is None:
+            # Imported here: aif.tools imports this module
+            from aif.tools import AskUserTool
+            self._ask_tool = AskUserTool(self)
+        return self._ask_tool
 
     def add_to_history(self, role: str, content: str):
         """Add a message to the conversation history."""
-        self.history.append({"role": role, "content": content})
+        # Roles are interned so every entry shares one string object per role
+        self.history.append({"role": sys.intern(role) if type(role) is str else role, "content": content})
 
     def get_history(self) -> List[Dict[str, str]]:
         """Get the full conversation history."""
@@ -76,38 +125,53 @@ class InteractionManager:
         Ask user a question.
         Parses commands and raises Control Flow exceptions if needed.
         """
+        raw_input = await self._raw_ask(question)
+
+        # Plain feedback (the common case) costs a single startswith
+        if raw_input.startswith("/"):
+            head, _, rest = raw_input.partition(" ")
+            head = head.lower()
+            make_exception = _COMMANDS.get(head)
+            if make_exception is None:
+                # Argument not separated by a space, e.g. "/rollbackwrong model"
+                for command, factory in _COMMANDS.items():
+                    if head.startswith(command):
+                        make_exception = factory
+                        rest = raw_input[len(command):]
+                        break
+            if make_exception is not None:
+                raise make_exception(rest.strip())
+
+        return raw_input
+
+    async def _raw_ask(self, question: str) -> str:
+        """Ask the user and record the exchange in history, without command parsing."""
         self.current_question = question
-        self.add_to_history("system", question)
-        
-        # We try to await if it returns a coroutine, otherwise just use value.
-        # But we can't know before calling.
-        # So we just call it. If it returns awaitable, we await.
+        self.add_to_history(_ROLE_SYSTEM, question)
         
-        result = self.input_callback(question)
-        if hasattr(result, "__await__"):
+        # Coroutine functions are detected when the callback is set. Other callables may
+        # still return an awaitable (e.g. a lambda wrapping a coroutine), so
+        # only those pay for the isawaitable() probe.
+        result = self._input_callback(question)
+        if self._is_async or inspect.isawaitable(result):
             raw_input = await cast(Awaitable[str], result)
         else:
             raw_input = str(result)
 
         raw_input = raw_input.strip()
-        self.add_to_history("user", raw_input)
-        lower_input = raw_input.lower()
-
-        if lower_input.startswith("/exit"):
-            raise UserExitException("User requested exit")
-        if lower_input.startswith("/rollback"):
-            reason = raw_input[9:].strip() or "User requested rollback"
-            raise RollbackException(reason)
-        if lower_input.startswith("/retry"):
-            feedback = raw_input[6:].strip() or "User requested retry"
-            raise RetryException(feedback)
-
+        self.add_to_history(_ROLE_USER, raw_input)
         return raw_input
 
     async def get_initial_input(self) -> str:
-        """Get initial input, ask if missing."""
+        """
+        Get initial input, ask if missing.
+        Only /exit is honoured here: there is no step yet to rollback or retry,
+        so any other text is taken as the initial input.
+        """
         if self.initial_input:
             return self.initial_input
         
-        resp = await self.get_user_input("Please provide initial input:")
+        resp = await self._raw_ask("Please provide initial input:")
+        if resp.lower().startswith("/exit"):
+            raise UserExitException("User requested exit")
         return resp
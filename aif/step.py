@@ -1,35 +1,97 @@
 from __future__ import annotations
 
-from typing import Union, Callable, Optional, Any, Dict, Tuple
-from crewai import Crew, Agent, Task # pyright: ignore[reportMissingImports]
+from typing import Union, Callable, Optional, Any, Dict, Tuple, List, Iterator, TYPE_CHECKING
 from aif.artifact import Artifact
 from aif.constant import (
     HUMAN_ASK_PRINCIPLE, 
     RetryValidator,
+    CREW_INPUT_KEY,
+    FEEDBACK_TYPE_USER,
+    FEEDBACK_TYPE_VALIDATION,
+    FEEDBACK_TYPE_LABELS,
     FEEDBACK_CONTEXT_HEADER,
     FEEDBACK_CONTEXT_EXPLANATION,
     VALIDATION_CONTEXT_HEADER,
     VALIDATION_CONTEXT_EXPLANATION,
     CUMULATIVE_CONTEXT_INSTRUCTIONS,
     CUMULATIVE_CONTEXT_FEEDBACK_INSTRUCTION,
-    CUMULATIVE_CONTEXT_VALIDATION_INSTRUCTION
+    CUMULATIVE_CONTEXT_VALIDATION_INSTRUCTION,
+    USER_CONFIRMATION_OPTIONS,
+    RETRY_RECOMMENDATION,
+    _DEBUG_SEPARATOR
 )
 from aif.interactive import InteractionManager, UserExitException, RollbackException, RetryException
-from aif.tools import AskUserTool
 from aif.config import aif_config
-from aif.validators import validate_with_agent_or_crew
+from aif.validators import validate_with_agent_or_crew, build_validation_crew, ValidationCache
 import copy
+import sys
 
+if TYPE_CHECKING:
+    from crewai import Crew # pyright: ignore[reportMissingImports]
 
-ExecutableUnit = Union[Crew, Callable[[Artifact], Any]]
+
+ExecutableUnit = Union['Crew', Callable[[Artifact], Any]]
 OutputProcessor = Callable[[Any], Tuple[str, Any]]
 NextStep = Union[str, 'Step', Callable[[Artifact], Union[str, 'Step']], None]
 
+def _is_crew(obj: Any) -> bool:
+    """
+    Check for a CrewAI Crew without importing crewai.
+    Nothing can be a Crew before crewai is loaded, and importing it is slow.
+    """
+    crewai = sys.modules.get("crewai")
+    return crewai is not None and isinstance(obj, crewai.Crew)
+
+
+def _is_agent(obj: Any) -> bool:
+    """Check for a CrewAI Agent without importing crewai (see _is_crew())."""
+    crewai = sys.modules.get("crewai")
+    return crewai is not None and isinstance(obj, crewai.Agent)
+
+
+# Guard callback kinds, resolved when the callback is assigned
+_GUARD_NONE = 0
+_GUARD_FN = 1
+_GUARD_AGENT_OR_CREW = 2
+
+
+class FeedbackLog:
+    """
+    Chronological feedback collected during one Step execution.
+    Each item is a tuple (type, content) where type is FEEDBACK_TYPE_USER or
+    FEEDBACK_TYPE_VALIDATION. Which types are present is tracked on append,
+    so building the retry context needs no extra pass over the items.
+    """
+
+    __slots__ = ("items", "has_user_feedback", "has_validation_errors")
+
+    def __init__(self):
+        self.items: List[Tuple[str, str]] = []
+        self.has_user_feedback = False
+        self.has_validation_errors = False
+
+    def append(self, entry: Tuple[str, str]):
+        """Add a (type, content) entry."""
+        feedback_type = entry[0]
+        if feedback_type == FEEDBACK_TYPE_USER:
+            self.has_user_feedback = True
+        elif feedback_type == FEEDBACK_TYPE_VALIDATION:
+            self.has_validation_errors = True
+        self.items.append(entry)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
 class Step:
     """
     Step is the smallest execution unit in Flow, wrapping Crew or Callable.
     Each Step is independent and supports state reset on rollback.
     Supports separating step output from human display through output_processor.
+    A Step with an Agent guard reuses one validator Crew, so it must not be
+    executed concurrently.
     
     The Step object can be used directly as next_step parameter:
         search = flow.add_step(create_search_step(llm))
@@ -45,13 +107,36 @@ class Step:
         next_step: NextStep = None,
         require_user_confirmation: bool = True
     ):
-        self.name = name
+        # Used as dict key and Artifact.last_step throughout the Flow; only str can be interned
+        self.name = sys.intern(name) if type(name) is str else name
         self.executable_unit = step_object
         self.output_processor = output_processor
         self.should_retry_guard_callback = should_retry_guard_callback
         self.next_step = next_step
         self.require_user_confirmation = require_user_confirmation
     
+    @property
+    def should_retry_guard_callback(self) -> Optional[RetryValidator]:
+        """Validator run on each result; see _should_retry_guard()."""
+        return self._guard_callback
+
+    @should_retry_guard_callback.setter
+    def should_retry_guard_callback(self, callback: Optional[RetryValidator]):
+        # Classify once here instead of on every validation
+        self._guard_callback = callback
+        # Crew wrapping an Agent guard, built on first validation and reused;
+        # its task description is rewritten per validation (see class docstring)
+        self._agent_validation_crew: Optional[Crew] = None
+        # Verdicts of the Agent/Crew guard by result text; reset when the guard changes
+        self._validation_cache: Optional[ValidationCache] = None
+        if callback is None:
+            self._guard_kind = _GUARD_NONE
+        elif callable(callback) and not (_is_agent(callback) or _is_crew(callback)):
+            self._guard_kind = _GUARD_FN
+        else:
+            self._guard_kind = _GUARD_AGENT_OR_CREW
+            self._validation_cache = ValidationCache()
+
     def __str__(self) -> str:
         """Return step name when Step is used as string (e.g., in next_step)."""
         return self.name
@@ -94,92 +179,98 @@ class Step:
         """
         Execute the Step, handling automatic retries and user interaction.
         Returns Artifact on success.
+        
+        The output Artifact is built with model_construct(): its fields come from
+        this Step, so pydantic validation would only add per-step overhead.
         """
         # Track all feedback in chronological order with type distinction
-        # Each item is a tuple: (type, content) where type is 'user_feedback' or 'validation_error'
-        feedback_history = []
+        feedback_history = FeedbackLog()
         current_attempt = 0
 
+        # Step configuration doesn't change during one execute(); bind it to locals
+        step_name = self.name
+        has_guard = self._guard_kind != _GUARD_NONE
+        require_confirmation = self.require_user_confirmation
+        execute_once = self._execute_once
+        should_retry_guard = self._should_retry_guard
+        process_step_output = self._process_step_output
+
         while True:  # Manual Retry Loop
             current_attempt += 1
             
             try:
-                raw_result = await self._execute_once(input_artifact, interactive, feedback_history, current_attempt)
-                validation_passed = True
-                validation_error = None
+                raw_result = await execute_once(input_artifact, interactive, feedback_history, current_attempt)
+                # None means the result passed validation
+                validation_error: Optional[str] = None
                 
-                if self.should_retry_guard_callback:
-                    should_retry, reason = await self._should_retry_guard(raw_result)
+                if has_guard:
+                    should_retry, reason = await should_retry_guard(raw_result)
                     if should_retry:
-                        validation_passed = False
-                        validation_error = reason
+                        # Kept non-None even if the guard gave no reason
+                        validation_error = reason or ""
                         # Add validation error to feedback history with type marker
-                        feedback_history.append(('validation_error', reason))
+                        feedback_history.append((FEEDBACK_TYPE_VALIDATION, reason))
 
             except Exception as e:
                 raise e
             
             # Process step output - separate msg for display and pass_data for next step
-            msg, pass_data = self._process_step_output(raw_result)
+            msg, pass_data = process_step_output(raw_result)
             
             # Check if we can auto-approve
-            if validation_passed and not self.require_user_confirmation:
+            if validation_error is None and not require_confirmation:
                 print(f"   ✓ Auto-approved")
-                return Artifact(
-                    last_step=self.name,
+                return Artifact.model_construct(
+                    last_step=step_name,
                     pass_data=pass_data
                 )
 
             
-            display_msg = f"\n{msg}\n"
-            
-            if validation_error:
-                display_msg += f"Validation Not Pass!: {validation_error}\n"
-            
-            display_msg += "\n\nOptions:\n- Press Enter or type 'yes' to confirm and continue\n- Type feedback directly to retry step\n- '/rollback [reason]' to rollback flow"
-            
-            if not validation_passed:
-                display_msg += "\n(Recommended: Retry with your new comments)"
+            # Only the result and validation error vary; the option text is a shared constant
+            validation_line = f"Validation Not Pass!: {validation_error}\n" if validation_error else ""
+            recommendation = "" if validation_error is None else RETRY_RECOMMENDATION
+            display_msg = f"\n{msg}\n{validation_line}{USER_CONFIRMATION_OPTIONS}{recommendation}"
 
             try:
                 user_input = await interactive.get_user_input(display_msg)
                 
                 # Check for explicit "yes" or empty input (Enter key)
-                if user_input.strip().lower() == "yes" or user_input.strip() == "":
-                    return Artifact(
-                        last_step=self.name,
+                stripped = user_input.strip()
+                if not stripped or stripped.lower() == "yes":
+                    return Artifact.model_construct(
+                        last_step=step_name,
                         pass_data=pass_data
                     )
                 
                 # Treat as feedback/retry - add to history with type marker
                 feedback = user_input
-                feedback_history.append(('user_feedback', feedback))
+                feedback_history.append((FEEDBACK_TYPE_USER, feedback))
                 continue
 
             except RetryException as e:
                 # This catches explicit /retry commands if supported by interactive
                 feedback = str(e.args[0]) if e.args else "User requested retry"
-                feedback_history.append(('user_feedback', feedback))
+                feedback_history.append((FEEDBACK_TYPE_USER, feedback))
                 continue
 
             except (UserExitException, RollbackException):
                 raise
 
             except Exception as e:
-                error_msg = f"Step '{self.name}' execution failed with error: {str(e)}"
+                error_msg = f"Step '{step_name}' execution failed with error: {str(e)}"
                 try:
                     await interactive.get_user_input(f"{error_msg}\nOptions: /retry, /rollback, /exit")
                     continue
                 except RetryException as re:
                     feedback = str(re.args[0]) if re.args else str(e)
-                    feedback_history.append(('user_feedback', feedback))
+                    feedback_history.append((FEEDBACK_TYPE_USER, feedback))
                     continue
 
     async def _execute_once(
         self,
         input_artifact: Artifact,
         interactive: InteractionManager,
-        feedback_history: list,
+        feedback_history: FeedbackLog,
         current_attempt: int
     ) -> Any:
         """
@@ -192,12 +283,13 @@ class Step:
         Args:
             input_artifact: The input artifact containing the original request
             interactive: The interaction manager
-            feedback_history: List of tuples (type, content) in chronological order
-                            where type is 'user_feedback' or 'validation_error'
+            feedback_history: FeedbackLog of (type, content) entries in chronological order
             current_attempt: Current attempt number
         """
+        # Read the debug flag once per attempt
+        debug = aif_config.debug_step_execution
 
-        if isinstance(self.executable_unit, Crew):
+        if _is_crew(self.executable_unit):
             original_crew = self.executable_unit
             original_request: Any = input_artifact.pass_data
             
@@ -207,49 +299,44 @@ class Step:
                     "=== TASK CONTEXT ===",
                     f"Original request: {original_request}",
                     "",
-                    "=== FEEDBACK HISTORY (in chronological order) ==="
-                ]
-                
-                # Add explanations for both types
-                context_parts.extend([
+                    "=== FEEDBACK HISTORY (in chronological order) ===",
+                    # Add explanations for both types
                     FEEDBACK_CONTEXT_EXPLANATION,
                     VALIDATION_CONTEXT_EXPLANATION,
                     ""
-                ])
+                ]
                 
                 # Add all feedback in chronological order with type labels
-                has_user_feedback = False
-                has_validation_errors = False
-                
-                for i, (feedback_type, content) in enumerate(feedback_history, 1):
-                    if feedback_type == 'user_feedback':
-                        context_parts.append(f"{i}. [User Feedback] {content}")
-                        has_user_feedback = True
-                    elif feedback_type == 'validation_error':
-                        context_parts.append(f"{i}. [Validation Error] {content}")
-                        has_validation_errors = True
+                context_parts += [
+                    f"{i}. [{FEEDBACK_TYPE_LABELS[feedback_type]}] {content}"
+                    for i, (feedback_type, content) in enumerate(feedback_history, 1)
+                    if feedback_type in FEEDBACK_TYPE_LABELS
+                ]
                 
-                context_parts.append("")
+                # Instruction constants carry their own newlines, so they are
+                # concatenated as the last part instead of being joined with "\n"
+                instructions = [CUMULATIVE_CONTEXT_INSTRUCTIONS]
+                if feedback_history.has_user_feedback:
+                    instructions.append(CUMULATIVE_CONTEXT_FEEDBACK_INSTRUCTION)
+                if feedback_history.has_validation_errors:
+                    instructions.append(CUMULATIVE_CONTEXT_VALIDATION_INSTRUCTION)
+                context_parts.append("".join(instructions))
                 
                 # Build final context with instructions
-                cumulative_context = "\n".join(context_parts)
-                cumulative_context += CUMULATIVE_CONTEXT_INSTRUCTIONS
-                if has_user_feedback:
-                    cumulative_context += CUMULATIVE_CONTEXT_FEEDBACK_INSTRUCTION
-                if has_validation_errors:
-                    cumulative_context += CUMULATIVE_CONTEXT_VALIDATION_INSTRUCTION
-                
-                inputs: Dict[str, Any] = {"input": cumulative_context}
+                crew_input = "\n".join(context_parts)
             else:
                 # First attempt, use original request directly
-                inputs: Dict[str, Any] = {"input": original_request}
+                crew_input = original_request
 
-            ask_tool = AskUserTool(interactive)
+            inputs: Dict[str, Any] = {CREW_INPUT_KEY: crew_input}
+
+            ask_tool = interactive.get_ask_tool()
 
             # Deep copy the crew using its native copy method
             # This preserves all attributes/methods and graph integrity (tasks -> agents, task -> context)
-            if hasattr(original_crew, "copy"):
-                 crew = original_crew.copy()
+            clone_crew = getattr(original_crew, "copy", None)
+            if clone_crew is not None:
+                 crew = clone_crew()
             else:
                  # Fallback if .copy() is unavailable (unlikely in recent CrewAI)
                  crew = copy.copy(original_crew)
@@ -260,21 +347,26 @@ class Step:
                 agent.tools = current_tools + [ask_tool]
 
             # Debug: Print actual inputs for Crew
-            if aif_config.is_debug_step_enabled():
-                print(f"      ","-"*15)
-                print(f"   🔍 [Debug] Crew kickoff")
-                print(f"      - Current Attempt: {current_attempt}")
+            if debug:
+                # Collected into one string so the report is a single write
+                debug_lines = [
+                    _DEBUG_SEPARATOR,
+                    "   🔍 [Debug] Crew kickoff",
+                    f"      - Current Attempt: {current_attempt}",
+                ]
                 if feedback_history:
-                    print(f"      - Feedback History ({len(feedback_history)} items in chronological order):")
-                    for i, (feedback_type, content) in enumerate(feedback_history, 1):
-                        print(f"        {i}. [{feedback_type}] {content}")
+                    debug_lines.append(f"      - Feedback History ({len(feedback_history)} items in chronological order):")
+                    debug_lines += [
+                        f"        {i}. [{feedback_type}] {content}"
+                        for i, (feedback_type, content) in enumerate(feedback_history, 1)
+                    ]
                 # Display the complete inputs dict that will be passed to LLM
                 for key, value in inputs.items():
                     # Add indentation to multi-line values for better readability
-                    value_str = str(value)
-                    indented_value = '\n           '.join(value_str.split('\n'))
-                    print(f"   - Actual inputs:      {key}: {indented_value}")
-                    print(f"      ","-"*15)
+                    indented_value = str(value).replace("\n", "\n           ")
+                    debug_lines.append(f"   - Actual inputs:      {key}: {indented_value}")
+                    debug_lines.append(_DEBUG_SEPARATOR)
+                print("\n".join(debug_lines))
             if hasattr(crew, 'kickoff_async'):
                 return await crew.kickoff_async(inputs=inputs)
             else:
@@ -282,7 +374,7 @@ class Step:
 
         elif callable(self.executable_unit):
                     # Debug: Print input information
-            if aif_config.is_debug_step_enabled():
+            if debug:
                 print(f"   🔍 [Debug] Callable input: {input_artifact}")
             return self.executable_unit(input_artifact)
 
@@ -302,15 +394,21 @@ class Step:
         Returns:
             (should_retry, reason): True if validation failed and should retry
         """
-        if self.should_retry_guard_callback is None:
+        guard_kind = self._guard_kind
+        if guard_kind == _GUARD_NONE:
             return False, ""
         
         # Type 1: Traditional function validator
-        if callable(self.should_retry_guard_callback) and not isinstance(self.should_retry_guard_callback, (Agent, Crew)):
-            result_tuple = self.should_retry_guard_callback(result)
+        if guard_kind == _GUARD_FN:
+            result_tuple = self._guard_callback(result)
             if isinstance(result_tuple, tuple) and len(result_tuple) == 2:
                 return result_tuple
             return False, ""
         
         # Type 2 & 3: Agent or Crew validator (delegated to validators module)
-        return await validate_with_agent_or_crew(self.should_retry_guard_callback, result)
+        guard = self._guard_callback
+        if self._agent_validation_crew is None and _is_agent(guard):
+            self._agent_validation_crew = build_validation_crew(guard)
+        return await validate_with_agent_or_crew(
+            guard, result, self._validation_cache, self._agent_validation_crew
+        )
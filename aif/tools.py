@@ -28,26 +28,26 @@ class AskUserTool(BaseTool):
         
         This method bridges the synchronous execution model of standard Tools 
         with the asynchronous nature of InteractionManager.
-        It detects if an asyncio loop is running and schedules the user interaction accordingly.
+        CrewAI runs sync tools in a worker thread during async kickoff; the question
+        is then scheduled onto the flow's event loop (InteractionManager.loop) and
+        this thread waits for the answer. Without a running flow loop, a private
+        loop is used instead.
         """
         if not self.interactive:
             return "Error: InteractionManager not configured."
         
         try:
             try:
-                loop = asyncio.get_running_loop()
+                asyncio.get_running_loop()
             except RuntimeError:
-                loop = None
+                pass
+            else:
+                # Called on an event loop thread: blocking here for the answer
+                # would stop the loop that has to produce it
+                return "Error communicating with user: Ask User must be awaited when called from the event loop thread."
 
-            if loop and loop.is_running():
-                # We are likely inside an async loop (e.g., Flow.run).
-                # To execute the async get_user_input from this sync method, we need to schedule it.
-                # Note: This assumes the sync method is running in a different thread or 
-                # can block safely without deadlocking the loop if using run_coroutine_threadsafe.
-                # If running in the same thread as the loop, this calls for specific async handling 
-                # which standard sync tools don't support naturally.
-                # We assume here that CrewAI/LangChain executes tools in a way that permits this,
-                # or that the loop is available for scheduling.
+            loop = self.interactive.loop
+            if loop is not None and loop.is_running():
                 future = asyncio.run_coroutine_threadsafe(
                     self.interactive.get_user_input(question), loop
                 )
@@ -58,3 +58,12 @@ class AskUserTool(BaseTool):
 
         except Exception as e:
             return f"Error communicating with user: {str(e)}"
+
+    async def _arun(self, question: str) -> str:
+        """Execute the tool natively on the caller's event loop."""
+        if not self.interactive:
+            return "Error: InteractionManager not configured."
+        try:
+            return await self.interactive.get_user_input(question)
+        except Exception as e:
+            return f"Error communicating with user: {str(e)}"
@@ -7,14 +7,169 @@ handling Agent and Crew-based validators that use LLMs for intelligent validatio
 
 from __future__ import annotations
 
-from typing import Any
-import json
-from crewai import Crew, Agent, Task  # pyright: ignore[reportMissingImports]
+import asyncio
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from pydantic import BaseModel, ValidationError, field_validator  # pyright: ignore[reportMissingImports]
+from aif.artifact import Artifact
+from aif.constant import VALIDATION_INPUT_KEY
+
+if TYPE_CHECKING:
+    from crewai import Crew, Agent  # pyright: ignore[reportMissingImports]
+
+
+# Body of a markdown code fence, up to the closing fence or the end. A bare ```
+# only counts at the start of the response, so backticks inside the strings of
+# an unfenced reply are left alone; ```json is recognised anywhere.
+_FENCE_RE = re.compile(r"(?:\A\s*```(?:json)?|```json)(.*?)(?:```|\Z)", re.S)
+
+
+class ValidationResponse(BaseModel):
+    """JSON response expected from an Agent or Crew validator."""
+    should_retry: bool = False
+    reason: Optional[str] = ""
+    issues: Optional[List[Any]] = []
+    suggestions: Optional[List[Any]] = []
+
+    # LLMs don't follow the format exactly; loose shapes are coerced rather
+    # than rejected, since a rejected reply would force a retry
+
+    @field_validator("reason", mode="before")
+    @classmethod
+    def _coerce_reason(cls, value: Any) -> Any:
+        # e.g. "reason": null when nothing is wrong, or a number/list
+        if value is None:
+            return ""
+        return value if isinstance(value, str) else str(value)
+
+    @field_validator("issues", "suggestions", mode="before")
+    @classmethod
+    def _coerce_list(cls, value: Any) -> Any:
+        # e.g. null, "" or a single string instead of a list
+        if isinstance(value, list):
+            return value
+        return [value] if value else []
+
+
+# Task description for Agent validators; _RESULT_PLACEHOLDER is replaced with
+# the result on each call. The result comes last so every call shares the same prompt prefix, which
+# providers with prompt caching can reuse.
+_AGENT_VALIDATION_PROMPT = """
+You are a validation expert. Your task is to validate the result given at the end and determine if it needs to be retried.
+
+Your validation should check:
+1. Is the result complete and well-formed?
+2. Does it contain all required information?
+3. Are there any errors or inconsistencies?
+4. Does it meet the expected quality standards?
+
+You MUST respond in the following JSON format:
+{
+    "should_retry": true/false,
+    "reason": "Detailed explanation of why retry is needed (or empty if validation passed)",
+    "issues": ["List of specific issues found (empty if none)"],
+    "suggestions": ["Suggestions for improvement (empty if none)"]
+}
+
+IMPORTANT: Return ONLY valid JSON, no additional text.
+
+Result to validate:
+{validation_input}
+"""
+_RESULT_PLACEHOLDER = "{validation_input}"
+
+
+def build_validation_crew(agent: Agent) -> Crew:
+    """
+    Wrap an Agent validator in a single-task Crew.
+    
+    Build it once and pass it to validate_with_agent_or_crew as agent_crew;
+    the Task description is filled in with the result on each call. That makes
+    the Crew shared state: don't validate with the same Crew concurrently, or
+    one call's result can replace another's before kickoff reads it.
+    
+    Args:
+        agent: The Agent that performs the validation
+        
+    Returns:
+        Crew: A Crew to pass as validate_with_agent_or_crew(..., agent_crew=...)
+    """
+    # crewai is slow to import; it is only loaded once an LLM validator is used
+    from crewai import Crew, Task  # pyright: ignore[reportMissingImports]
+
+    validation_task = Task(
+        description=_AGENT_VALIDATION_PROMPT,
+        expected_output="JSON object with validation result",
+        agent=agent
+    )
+    # A validator is stateless: no memory store or tool cache, whatever the
+    # installed CrewAI version defaults to
+    return Crew(
+        agents=[agent],
+        tasks=[validation_task],
+        verbose=False,
+        memory=False,
+        cache=False
+    )
+
+
+async def _kickoff(crew: Crew, inputs: Optional[Dict[str, Any]] = None) -> Any:
+    """Run a Crew without blocking the event loop while the LLM responds."""
+    if hasattr(crew, 'kickoff_async'):
+        return await crew.kickoff_async(inputs=inputs)
+    return await asyncio.to_thread(crew.kickoff, inputs=inputs)
+
+
+class ValidationCache:
+    """
+    Bounded LRU cache of validator verdicts, keyed by the exact result text.
+    
+    Retry loops often produce the same result more than once; a hit returns
+    the stored (should_retry, reason) without another LLM call. Keys are
+    16-byte blake2b digests, so large results are not kept alive by the cache.
+    """
+
+    __slots__ = ("maxsize", "_entries")
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, Tuple[bool, str]] = OrderedDict()
+
+    @staticmethod
+    def _key(result_str: str) -> bytes:
+        return hashlib.blake2b(result_str.encode(), digest_size=16).digest()
+
+    def get(self, result_str: str) -> Optional[Tuple[bool, str]]:
+        """Return the cached verdict for result_str, or None on a miss."""
+        key = self._key(result_str)
+        verdict = self._entries.get(key)
+        if verdict is not None:
+            self._entries.move_to_end(key)
+        return verdict
+
+    def put(self, result_str: str, verdict: Tuple[bool, str]):
+        """Store the verdict for result_str, evicting the least recently used entry if full."""
+        key = self._key(result_str)
+        self._entries[key] = verdict
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached verdicts."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 async def validate_with_agent_or_crew(
     guard_callback: Agent | Crew,
-    result: Any
+    result: Any,
+    cache: Optional[ValidationCache] = None,
+    agent_crew: Optional[Crew] = None
 ) -> tuple[bool, str]:
     """
     Validate result using Agent or Crew-based validator.
@@ -23,6 +178,9 @@ async def validate_with_agent_or_crew(
     1. Agent: Uses a single LLM agent to intelligently validate results
     2. Crew: Uses multiple agents for complex validation scenarios
     
+    An Agent is wrapped with build_validation_crew() on each call unless
+    agent_crew is given; callers that validate repeatedly should build it once.
+    
     The validator analyzes the result and returns structured feedback in JSON format,
     including whether a retry is needed, the reason, specific issues found, and
     suggestions for improvement.
@@ -30,83 +188,65 @@ async def validate_with_agent_or_crew(
     Args:
         guard_callback: An Agent or Crew instance to perform validation
         result: The result to validate
+        cache: Optional ValidationCache; a verdict for the same result text is
+            returned from it without calling the validator
+        agent_crew: Optional Crew from build_validation_crew(guard_callback),
+            reused for an Agent validator (ignored for a Crew); must not be
+            in use by another concurrent call
         
     Returns:
         tuple[bool, str]: (should_retry, reason)
             - should_retry: True if validation failed and retry is needed
             - reason: Detailed explanation including issues and suggestions
             
-    Raises:
-        json.JSONDecodeError: If validator returns invalid JSON
-        Exception: For other validation errors
+    Invalid JSON, a response that doesn't match ValidationResponse, or any other
+    error while validating is reported as (True, <error description>). Loose
+    field shapes (null, a single string instead of a list, a non-str reason)
+    are coerced, not treated as errors.
     """
-    try:
-        # Prepare validation input
-        result_str = str(result)
-        
-        validation_prompt = f"""
-You are a validation expert. Your task is to validate the following result and determine if it needs to be retried.
-
-Result to validate:
-{result_str}
+    from crewai import Crew, Agent  # pyright: ignore[reportMissingImports]
 
-Your validation should check:
-1. Is the result complete and well-formed?
-2. Does it contain all required information?
-3. Are there any errors or inconsistencies?
-4. Does it meet the expected quality standards?
-
-You MUST respond in the following JSON format:
-{{
-    "should_retry": true/false,
-    "reason": "Detailed explanation of why retry is needed (or empty if validation passed)",
-    "issues": ["List of specific issues found (empty if none)"],
-    "suggestions": ["Suggestions for improvement (empty if none)"]
-}}
-
-IMPORTANT: Return ONLY valid JSON, no additional text.
-"""
+    try:
+        # Prepare validation input: strings pass through, dicts/lists and plain
+        # models are serialized to JSON in one call (see Artifact.dump_data_to_str)
+        result_str = Artifact.dump_data_to_str(result)
+        if cache is not None:
+            cached = cache.get(result_str)
+            if cached is not None:
+                return cached
         
         # Execute validation based on type
         if isinstance(guard_callback, Agent):
-            # Single agent validation
-            validation_task = Task(
-                description=validation_prompt,
-                expected_output="JSON object with validation result",
-                agent=guard_callback
-            )
-            
-            validation_crew = Crew(
-                agents=[guard_callback],
-                tasks=[validation_task],
-                verbose=False
-            )
-            
-            validation_result = validation_crew.kickoff()
-            
+            # Single agent validation. The result goes straight into the Task
+            # description and the Crew is kicked off without inputs: with inputs,
+            # CrewAI would also interpolate the Agent's role/goal/backstory, and
+            # literal braces there would fail as missing template variables.
+            if agent_crew is None:
+                agent_crew = build_validation_crew(guard_callback)
+            agent_crew.tasks[0].description = _AGENT_VALIDATION_PROMPT.replace(_RESULT_PLACEHOLDER, result_str)
+            validation_result = await _kickoff(agent_crew)
         elif isinstance(guard_callback, Crew):
             # Crew validation (already has agents and tasks configured)
-            validation_result = guard_callback.kickoff(
-                inputs={"validation_input": result_str}
-            )
+            validation_result = await _kickoff(guard_callback, {VALIDATION_INPUT_KEY: result_str})
         else:
             return False, ""
         
         # Parse validation result
         validation_str = str(validation_result)
         
-        # Extract JSON from result (handle markdown code blocks)
-        if "```json" in validation_str:
-            json_start = validation_str.find("```json") + 7
-            json_end = validation_str.find("```", json_start)
-            validation_str = validation_str[json_start:json_end].strip()
+        # Extract JSON from result (handle markdown code blocks).
+        # Surrounding whitespace is left in place; the JSON parser skips it.
+        fence = _FENCE_RE.search(validation_str)
+        if fence:
+            validation_str = fence.group(1)
         
-        validation_data = json.loads(validation_str)
+        # Parse and validate in one pass
+        validation_data = ValidationResponse.model_validate_json(validation_str)
         
-        should_retry = validation_data.get("should_retry", False)
-        reason = validation_data.get("reason", "")
-        issues = validation_data.get("issues", [])
-        suggestions = validation_data.get("suggestions", [])
+        should_retry = validation_data.should_retry
+        reason = validation_data.reason
+        issues = validation_data.issues
+        suggestions = validation_data.suggestions
         
         # Build detailed reason message
         if should_retry:
@@ -115,13 +255,21 @@ IMPORTANT: Return ONLY valid JSON, no additional text.
                 detailed_reason += f"\n\nIssues found:\n" + "\n".join(f"  - {issue}" for issue in issues)
             if suggestions:
                 detailed_reason += f"\n\nSuggestions:\n" + "\n".join(f"  - {suggestion}" for suggestion in suggestions)
-            return True, detailed_reason
+            verdict = (True, detailed_reason)
+        else:
+            verdict = (False, "")
         
-        return False, ""
+        # Only well-formed verdicts are cached; errors below are retried next time
+        if cache is not None:
+            cache.put(result_str, verdict)
+        return verdict
         
-    except json.JSONDecodeError as e:
-        print(f"   ⚠️  Validator returned invalid JSON: {e}")
-        return True, f"Validator error: Invalid JSON response - {str(e)}"
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            print(f"   ⚠️  Validator returned invalid JSON: {e}")
+            return True, f"Validator error: Invalid JSON response - {str(e)}"
+        print(f"   ⚠️  Validator response has an unexpected format: {e}")
+        return True, f"Validator error: Unexpected response format - {str(e)}"
     except Exception as e:
         print(f"   ⚠️  Validation failed with error: {e}")
         return True, f"Validation error: {str(e)}"
@@ -0,0 +1,5 @@
+import os
+
+# Keep CrewAI from sending telemetry while the tests import and run it
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
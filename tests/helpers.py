@@ -0,0 +1,14 @@
+from pydantic import BaseModel, ConfigDict  # pyright: ignore[reportMissingImports]
+
+
+class Opaque:
+    """A type pydantic can hold but not serialize."""
+
+    def __repr__(self):
+        return "Opaque()"
+
+
+class OpaqueModel(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    name: str = "x"
+    value: Opaque
@@ -0,0 +1,44 @@
+import unittest
+
+from pydantic import BaseModel  # pyright: ignore[reportMissingImports]
+
+from aif.artifact import Artifact
+from helpers import Opaque, OpaqueModel
+
+
+class PlainModel(BaseModel):
+    name: str
+    count: int
+
+
+class DumpDataToStrTest(unittest.TestCase):
+    def test_plain_model_renders_as_json(self):
+        text = Artifact.dump_data_to_str(PlainModel(name="a", count=1))
+        self.assertEqual(text, '{\n  "name": "a",\n  "count": 1\n}')
+
+    def test_unserializable_model_falls_back_to_str(self):
+        model = OpaqueModel(value=Opaque())
+        self.assertEqual(Artifact.dump_data_to_str(model), str(model))
+
+    def test_get_data_as_str_with_unserializable_model(self):
+        model = OpaqueModel(value=Opaque())
+        artifact = Artifact(pass_data=model)
+        self.assertEqual(artifact.get_data_as_str(), str(model))
+
+
+class GetDataAsBytesTest(unittest.TestCase):
+    def test_plain_model_matches_str_form(self):
+        artifact = Artifact(pass_data=PlainModel(name="a", count=1))
+        self.assertEqual(artifact.get_data_as_bytes(), artifact.get_data_as_str().encode("utf-8"))
+
+    def test_unserializable_model_falls_back_to_str(self):
+        model = OpaqueModel(value=Opaque())
+        artifact = Artifact(pass_data=model)
+        self.assertEqual(artifact.get_data_as_bytes(), str(model).encode("utf-8"))
+
+    def test_bytes_payload_is_returned_unchanged(self):
+        self.assertEqual(Artifact(pass_data=b"raw").get_data_as_bytes(), b"raw")
+
+
+if __name__ == "__main__":
+    unittest.main()
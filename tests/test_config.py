@@ -0,0 +1,21 @@
+import unittest
+
+from aif.config import AIFConfig, aif_config
+
+
+class SingletonTest(unittest.TestCase):
+    def test_constructor_returns_shared_instance(self):
+        self.assertIs(AIFConfig(), aif_config)
+
+    def test_reconstructing_keeps_settings(self):
+        enabled = aif_config.debug_step_execution
+        try:
+            aif_config.enable_debug_step(not enabled)
+            AIFConfig()
+            self.assertEqual(aif_config.debug_step_execution, not enabled)
+        finally:
+            aif_config.enable_debug_step(enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
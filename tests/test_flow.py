@@ -0,0 +1,25 @@
+import asyncio
+import unittest
+
+from aif.flow import AIFFlow
+from aif.interactive import InteractionManager
+from aif.step import Step
+
+
+class ImplicitNextTest(unittest.TestCase):
+    def _flow(self):
+        flow = AIFFlow(InteractionManager(input))
+        flow.add_step_from_crew("a", lambda artifact: "from a", next_step="b", require_user_confirmation=False)
+        flow.step_map["b"] = Step("b", lambda artifact: "from b", require_user_confirmation=False)
+        return flow
+
+    def test_step_added_to_step_map_ends_the_flow(self):
+        result = asyncio.run(self._flow().run("start"))
+        self.assertEqual(result.last_step, "b")
+
+    def test_inspect_lists_step_added_to_step_map(self):
+        self._flow().inspect()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import asyncio
+import unittest
+from enum import Enum
+
+from aif.interactive import InteractionManager
+
+
+class HistoryTest(unittest.TestCase):
+    def test_history_is_the_live_list(self):
+        manager = InteractionManager(lambda question: " blue ")
+        asyncio.run(manager.get_user_input("Colour?"))
+        self.assertEqual(manager.history, [
+            {"role": "system", "content": "Colour?"},
+            {"role": "user", "content": "blue"},
+        ])
+        self.assertIs(manager.get_history(), manager.history)
+
+        manager.history.clear()
+        manager.history.append({"role": "user", "content": "restored"})
+        self.assertEqual(manager.get_history(), [{"role": "user", "content": "restored"}])
+
+    def test_str_subclass_role_is_kept(self):
+        class Role(str, Enum):
+            ASSISTANT = "assistant"
+
+        manager = InteractionManager(input)
+        manager.add_to_history(Role.ASSISTANT, "hi")
+        self.assertIs(manager.history[0]["role"], Role.ASSISTANT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+from enum import Enum
+
+from aif.step import Step
+
+
+class StepNameTest(unittest.TestCase):
+    def test_str_name_is_interned(self):
+        name = "".join(["bu", "ild"])
+        self.assertIs(Step(name, lambda artifact: None).name, "build")
+
+    def test_str_subclass_name_is_kept(self):
+        class StepName(str, Enum):
+            BUILD = "build"
+
+        self.assertIs(Step(StepName.BUILD, lambda artifact: None).name, StepName.BUILD)
+
+
+if __name__ == "__main__":
+    unittest.main()
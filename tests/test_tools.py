@@ -0,0 +1,57 @@
+import asyncio
+import threading
+import unittest
+
+from aif.flow import AIFFlow
+from aif.interactive import InteractionManager
+from aif.tools import AskUserTool
+
+
+class AskUserToolTest(unittest.TestCase):
+    def test_worker_thread_question_runs_on_flow_loop(self):
+        answered_on = []
+
+        async def answer(question):
+            answered_on.append(threading.current_thread())
+            return "blue"
+
+        manager = InteractionManager(answer)
+        tool = AskUserTool(manager)
+
+        async def main():
+            manager.loop = asyncio.get_running_loop()
+            reply = await asyncio.to_thread(tool._run, "Colour?")
+            return reply, threading.current_thread()
+
+        reply, loop_thread = asyncio.run(main())
+        self.assertEqual(reply, "blue")
+        self.assertEqual(answered_on, [loop_thread])
+
+    def test_blocking_call_on_loop_thread_is_refused(self):
+        manager = InteractionManager(lambda question: "blue")
+        tool = AskUserTool(manager)
+
+        async def main():
+            manager.loop = asyncio.get_running_loop()
+            return tool._run("Colour?")
+
+        reply = asyncio.run(main())
+        self.assertTrue(reply.startswith("Error communicating with user:"))
+        self.assertEqual(manager.history, [])
+
+    def test_flow_run_records_its_loop(self):
+        seen = []
+        manager = InteractionManager(lambda question: "")
+        flow = AIFFlow(interactive=manager)
+        flow.add_step_from_crew(
+            name="only",
+            step_object=lambda artifact: seen.append(manager.loop is asyncio.get_running_loop()),
+            require_user_confirmation=False,
+        )
+
+        asyncio.run(flow.run("go"))
+        self.assertEqual(seen, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from crewai import Agent, Crew  # pyright: ignore[reportMissingImports]
+from crewai.llms.base_llm import BaseLLM  # pyright: ignore[reportMissingImports]
+
+from aif.constant import VALIDATION_INPUT_KEY
+from aif.validators import validate_with_agent_or_crew, build_validation_crew, ValidationCache
+from helpers import Opaque, OpaqueModel
+
+
+class StubLLM(BaseLLM):
+    """LLM returning canned replies and recording the last message of each prompt."""
+
+    def __init__(self, replies):
+        super().__init__(model="stub")
+        self._replies = list(replies)
+        self.prompts = []
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        self.prompts.append(messages if isinstance(messages, str) else messages[-1]["content"])
+        return self._replies.pop(0)
+
+    def supports_function_calling(self):
+        return False
+
+    def supports_stop_words(self):
+        return False
+
+    def get_context_window_size(self):
+        return 8000
+
+
+class ValidateWithCrewTest(unittest.TestCase):
+    def _validate(self, result, reply='{"should_retry": false}'):
+        """Validate result with a Crew whose kickoff_async records its inputs and returns reply."""
+        received = []
+
+        async def kickoff_async(crew_self, inputs=None):
+            received.append(inputs)
+            return reply
+
+        with mock.patch.object(Crew, "kickoff_async", kickoff_async):
+            verdict = asyncio.run(validate_with_agent_or_crew(Crew.model_construct(), result))
+        return verdict, received
+
+    def test_unserializable_result_still_reaches_validator(self):
+        model = OpaqueModel(value=Opaque())
+        verdict, received = self._validate(model)
+        self.assertEqual(verdict, (False, ""))
+        self.assertEqual(received, [{VALIDATION_INPUT_KEY: str(model)}])
+
+    def test_retry_verdict_includes_issues_and_suggestions(self):
+        reply = '```json\n{"should_retry": true, "reason": "short", "issues": ["a"], "suggestions": ["b"]}\n```'
+        verdict, _ = self._validate("draft", reply)
+        self.assertEqual(verdict, (True, "short\n\nIssues found:\n  - a\n\nSuggestions:\n  - b"))
+
+    def test_backticks_in_unfenced_reply_are_kept(self):
+        reply = '{"should_retry": true, "reason": "r", "suggestions": ["Wrap the snippet in ``` fences"]}'
+        verdict, _ = self._validate("draft", reply)
+        self.assertEqual(verdict, (True, "r\n\nSuggestions:\n  - Wrap the snippet in ``` fences"))
+
+    def test_fenced_reply_after_prose_is_extracted(self):
+        verdict, _ = self._validate("draft", 'Here you go:\n```json\n{"should_retry": true, "reason": "r"}\n```')
+        self.assertEqual(verdict, (True, "r"))
+
+    def test_bare_fence_at_start_is_stripped(self):
+        verdict, _ = self._validate("draft", '```\n{"should_retry": true, "reason": "r"}\n```')
+        self.assertEqual(verdict, (True, "r"))
+
+    def test_null_fields_are_a_pass(self):
+        reply = '{"should_retry": false, "reason": null, "issues": null, "suggestions": null}'
+        verdict, _ = self._validate("draft", reply)
+        self.assertEqual(verdict, (False, ""))
+
+    def test_null_fields_on_retry_are_left_out(self):
+        verdict, _ = self._validate("draft", '{"should_retry": true, "reason": "thin", "issues": null}')
+        self.assertEqual(verdict, (True, "thin"))
+
+    def test_scalar_issues_on_pass_are_a_pass(self):
+        verdict, _ = self._validate("draft", '{"should_retry": false, "issues": "None"}')
+        self.assertEqual(verdict, (False, ""))
+
+    def test_scalar_issues_on_retry_become_a_list(self):
+        verdict, _ = self._validate("draft", '{"should_retry": true, "reason": "bad", "issues": "missing field x"}')
+        self.assertEqual(verdict, (True, "bad\n\nIssues found:\n  - missing field x"))
+
+    def test_non_str_reason_is_stringified(self):
+        verdict, _ = self._validate("draft", '{"should_retry": true, "reason": 42}')
+        self.assertEqual(verdict, (True, "42"))
+
+    def test_syntax_error_is_reported_as_invalid_json(self):
+        (retry, reason), _ = self._validate("draft", '{"should_retry": true')
+        self.assertTrue(retry)
+        self.assertIn("Invalid JSON response", reason)
+
+    def test_wrong_shape_is_not_reported_as_invalid_json(self):
+        (retry, reason), _ = self._validate("draft", "[1]")
+        self.assertTrue(retry)
+        self.assertIn("Unexpected response format", reason)
+
+
+class ValidationCacheTest(unittest.TestCase):
+    def _validate_twice(self, replies):
+        """Validate the same result twice through one cache; return both verdicts and the kickoff count."""
+        replies = list(replies)
+        calls = []
+
+        async def kickoff_async(crew_self, inputs=None):
+            calls.append(inputs)
+            return replies.pop(0)
+
+        cache = ValidationCache()
+        crew = Crew.model_construct()
+        with mock.patch.object(Crew, "kickoff_async", kickoff_async):
+            first = asyncio.run(validate_with_agent_or_crew(crew, "draft", cache))
+            second = asyncio.run(validate_with_agent_or_crew(crew, "draft", cache))
+        return first, second, len(calls)
+
+    def test_repeated_result_is_served_from_cache(self):
+        first, second, kickoffs = self._validate_twice(['{"should_retry": true, "reason": "thin"}'])
+        self.assertEqual(first, (True, "thin"))
+        self.assertEqual(second, first)
+        self.assertEqual(kickoffs, 1)
+
+    def test_errors_are_not_cached(self):
+        first, second, kickoffs = self._validate_twice(["not json", '{"should_retry": false}'])
+        self.assertTrue(first[0])
+        self.assertTrue(first[1].startswith("Validator error:"))
+        self.assertEqual(second, (False, ""))
+        self.assertEqual(kickoffs, 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ValidationCache(maxsize=2)
+        cache.put("a", (False, ""))
+        cache.put("b", (True, "b"))
+        self.assertEqual(cache.get("a"), (False, ""))  # "b" is now least recently used
+        cache.put("c", (True, "c"))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), (False, ""))
+        self.assertEqual(cache.get("c"), (True, "c"))
+
+
+class ValidateWithAgentTest(unittest.TestCase):
+    def test_braces_in_agent_fields_are_not_template_variables(self):
+        llm = StubLLM([
+            'Thought: ok\nFinal Answer: {"should_retry": false}',
+            'Thought: ok\nFinal Answer: {"should_retry": true, "reason": "thin"}',
+        ])
+        agent = Agent(role="reviewer", goal="Check the {topic} summary", backstory="b", llm=llm)
+        crew = build_validation_crew(agent)
+
+        first = asyncio.run(validate_with_agent_or_crew(agent, "first {draft}", agent_crew=crew))
+        second = asyncio.run(validate_with_agent_or_crew(agent, "second", agent_crew=crew))
+
+        self.assertEqual(first, (False, ""))
+        self.assertEqual(second, (True, "thin"))
+        self.assertIn("Result to validate:\nfirst {draft}", llm.prompts[0])
+        self.assertIn("Result to validate:\nsecond", llm.prompts[1])
+        self.assertEqual(agent.goal, "Check the {topic} summary")
+
+
+if __name__ == "__main__":
+    unittest.main()